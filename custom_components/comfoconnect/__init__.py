@@ -191,15 +191,16 @@ class ComfoConnectBridge(ComfoConnect):
             self.alarm_callback,
         )
         self.hass = hass
+        self._signals: dict[int, str] = {}
 
     @callback
     def sensor_callback(self, sensor: Sensor, value):
         """Notify listeners that we have received an update."""
-        dispatcher_send(
-            self.hass,
-            SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self.uuid, sensor.id),
-            value,
-        )
+        signal = self._signals.get(sensor.id)
+        if signal is None:
+            signal = self._signals[sensor.id] = SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self.uuid, sensor.id)
+
+        dispatcher_send(self.hass, signal, value)
 
     @callback
     def alarm_callback(self, node_id, errors):
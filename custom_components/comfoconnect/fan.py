@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import logging
 import asyncio
+import logging
+from contextlib import suppress
+from types import MappingProxyType
 from typing import Any
 
 from aiocomfoconnect.const import VentilationMode, VentilationSpeed
@@ -14,7 +16,8 @@ from aiocomfoconnect.sensors import (
 )
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -27,20 +30,39 @@ from . import DOMAIN, SIGNAL_COMFOCONNECT_UPDATE_RECEIVED, ComfoConnectBridge
 
 _LOGGER = logging.getLogger(__name__)
 
-FAN_SPEEDS = [VentilationSpeed.LOW, VentilationSpeed.MEDIUM, VentilationSpeed.HIGH]
-PRESET_MODES = [VentilationMode.AUTO, VentilationMode.MANUAL]
+FAN_SPEEDS = (VentilationSpeed.LOW, VentilationSpeed.MEDIUM, VentilationSpeed.HIGH)
+PRESET_MODES = (VentilationMode.AUTO, VentilationMode.MANUAL)
+
+# Raw SENSOR_FAN_SPEED_MODE value → fan percentage
+SPEED_VALUE_TO_PERCENTAGE = MappingProxyType(
+    {
+        0: 0,
+        1: ordered_list_item_to_percentage(FAN_SPEEDS, VentilationSpeed.LOW),
+        2: ordered_list_item_to_percentage(FAN_SPEEDS, VentilationSpeed.MEDIUM),
+        3: ordered_list_item_to_percentage(FAN_SPEEDS, VentilationSpeed.HIGH),
+    }
+)
+
+# Fan percentage of each speed step → VentilationSpeed
+PERCENTAGE_TO_SPEED = MappingProxyType(
+    {
+        0: VentilationSpeed.AWAY,
+        **{ordered_list_item_to_percentage(FAN_SPEEDS, speed): speed for speed in FAN_SPEEDS},
+    }
+)
+
+MODE_MAPPING = MappingProxyType(
+    {
+        -1: VentilationMode.AUTO,
+        1: VentilationMode.MANUAL,
+    }
+)
 
-FAN_SPEED_MAPPING = {
-    0: VentilationSpeed.AWAY,
-    1: VentilationSpeed.LOW,
-    2: VentilationSpeed.MEDIUM,
-    3: VentilationSpeed.HIGH,
-}
+# Coalesce bursts of sensor updates into a single state write
+STATE_WRITE_COOLDOWN = 0.1
 
-MODE_MAPPING = {
-    -1: VentilationMode.AUTO,
-     1: VentilationMode.MANUAL,
-}
+# Maximum time to wait for the bridge to report a requested mode change
+MODE_ACK_TIMEOUT = 1.0
 
 
 async def async_setup_entry(
@@ -76,6 +98,21 @@ class ComfoConnectFan(FanEntity):
         self._attr_unique_id = self._ccb.uuid
         self._attr_preset_mode = None
         self._attr_percentage = 0
+        self._last_sent_speed: VentilationSpeed | None = None
+        self._requested_speed: VentilationSpeed | None = None
+        self._pending_speed: tuple[VentilationSpeed, int] | None = None
+        self._speed_task: asyncio.Task | None = None
+        self._requested_mode: str | None = None
+        self._pending_mode: str | None = None
+        self._mode_task: asyncio.Task | None = None
+        self._sig_speed = SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self._ccb.uuid, SENSOR_FAN_SPEED_MODE)
+        self._sig_mode = SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self._ccb.uuid, SENSOR_OPERATING_MODE)
+        self._debouncer: Debouncer | None = None
+        self._reported_mode: str | None = None
+        self._awaited_mode: str | None = None
+        self._mode_received = asyncio.Event()
+        # The Manual → Auto toggle shares _awaited_mode and _mode_received, so only one may run at a time
+        self._turn_on_lock = asyncio.Lock()
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._ccb.uuid)},
             manufacturer="ComfoConnect",
@@ -85,10 +122,18 @@ class ComfoConnectFan(FanEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register for sensor updates."""
+        self._debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=STATE_WRITE_COOLDOWN,
+            immediate=True,
+            function=self._async_flush_state,
+        )
+
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self._ccb.uuid, SENSOR_FAN_SPEED_MODE),
+                self._sig_speed,
                 self._handle_speed_update,
             )
         )
@@ -97,26 +142,62 @@ class ComfoConnectFan(FanEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                SIGNAL_COMFOCONNECT_UPDATE_RECEIVED.format(self._ccb.uuid, SENSOR_OPERATING_MODE),
+                self._sig_mode,
                 self._handle_mode_update,
             )
         )
         await self._ccb.register_sensor(SENSORS.get(SENSOR_OPERATING_MODE))
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending state write and command."""
+        if self._debouncer:
+            self._debouncer.async_shutdown()
+        for task in (self._speed_task, self._mode_task):
+            if task:
+                task.cancel()
+
+    @callback
+    def _async_flush_state(self) -> None:
+        """Write the coalesced state to Home Assistant."""
+        self.async_write_ha_state()
+
+    @callback
     def _handle_speed_update(self, value: int) -> None:
         """Handle update callbacks."""
-        speed = FAN_SPEED_MAPPING.get(value, VentilationSpeed.LOW)
-        if speed == VentilationSpeed.AWAY:
-            self._attr_percentage = 0
-        else:
-            self._attr_percentage = ordered_list_item_to_percentage(FAN_SPEEDS, speed)
+        percentage = SPEED_VALUE_TO_PERCENTAGE.get(value)
+        if percentage is None or percentage == self._attr_percentage:
+            return
 
-        self.schedule_update_ha_state()
+        self._attr_percentage = percentage
+        # Keep in sync with speed changes made outside Home Assistant
+        self._last_sent_speed = PERCENTAGE_TO_SPEED[percentage]
+        self._debouncer.async_schedule_call()
 
+    @callback
     def _handle_mode_update(self, value: int) -> None:
         """Handle update callbacks."""
-        self._attr_preset_mode = MODE_MAPPING.get(value, VentilationMode.MANUAL)
-        self.schedule_update_ha_state()
+        preset_mode = MODE_MAPPING.get(value, VentilationMode.MANUAL)
+        self._reported_mode = preset_mode
+        if preset_mode == self._awaited_mode:
+            self._mode_received.set()
+        if preset_mode == self._attr_preset_mode:
+            return
+
+        self._attr_preset_mode = preset_mode
+        self._debouncer.async_schedule_call()
+
+    async def _async_set_preset_mode_and_wait(self, preset_mode: str) -> None:
+        """Set a preset mode and wait until the bridge reports it."""
+        self._awaited_mode = preset_mode
+        self._mode_received.clear()
+        try:
+            await self._async_send_mode(preset_mode)
+            # The bridge doesn't send a new report for a mode the unit is already in
+            if self._reported_mode != preset_mode:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._mode_received.wait(), MODE_ACK_TIMEOUT)
+        finally:
+            self._awaited_mode = None
 
     @property
     def is_on(self) -> bool:
@@ -130,23 +211,23 @@ class ComfoConnectFan(FanEntity):
         **kwargs: Any,
     ) -> None:
         """Turn on the fan, ensuring it correctly goes to AUTO mode."""
-        if not self.is_on:
-            # Zet fan aan (standaard laag)
-            if percentage is None:
-                percentage = ordered_list_item_to_percentage(FAN_SPEEDS, VentilationSpeed.LOW)
-            await self.async_set_percentage(percentage)
-
-            # Forceer twee mode switches: Manual → Auto
-            await self.async_set_preset_mode(VentilationMode.MANUAL)
-            await asyncio.sleep(0.5)
-            await self.async_set_preset_mode(VentilationMode.AUTO)
-        else:
-            # Fan is al aan, gewoon mode instellen als opgegeven
-            if preset_mode:
-                await self.async_set_preset_mode(preset_mode)
-            if percentage is not None:
+        async with self._turn_on_lock:
+            if not self.is_on:
+                # Zet fan aan (standaard laag)
+                if percentage is None:
+                    percentage = ordered_list_item_to_percentage(FAN_SPEEDS, VentilationSpeed.LOW)
                 await self.async_set_percentage(percentage)
 
+                # Forceer twee mode switches: Manual → Auto
+                await self._async_set_preset_mode_and_wait(VentilationMode.MANUAL)
+                await self._async_send_mode(VentilationMode.AUTO)
+            else:
+                # Fan is al aan, gewoon mode instellen als opgegeven
+                if preset_mode:
+                    await self.async_set_preset_mode(preset_mode)
+                if percentage is not None:
+                    await self.async_set_percentage(percentage)
+
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan (set to away)."""
         await self.async_set_percentage(0)
@@ -154,22 +235,69 @@ class ComfoConnectFan(FanEntity):
     async def async_set_percentage(self, percentage: int) -> None:
         """Set fan speed percentage."""
         percentage = max(0, min(percentage, 100))
-
-        if percentage == 0:
-            speed = VentilationSpeed.AWAY
-        else:
+        speed = PERCENTAGE_TO_SPEED.get(percentage)
+        if speed is None:
             speed = percentage_to_ordered_list_item(FAN_SPEEDS, percentage)
 
-        await self._ccb.set_speed(speed)
-        self._attr_percentage = percentage
-        self.schedule_update_ha_state()
+        # Compare against the latest queued or in-flight speed, the cached state lags behind the queue
+        current_speed = self._requested_speed if self._requested_speed is not None else self._last_sent_speed
+        if speed == current_speed:
+            return
+
+        self._requested_speed = speed
+        self._pending_speed = (speed, percentage)
+        if self._speed_task is None or self._speed_task.done():
+            self._speed_task = self.hass.async_create_task(self._async_send_pending_speed())
+        await asyncio.shield(self._speed_task)
+
+    async def _async_send_pending_speed(self) -> None:
+        """Send the latest requested speed, dropping speeds superseded while a command was in flight."""
+        try:
+            while (request := self._pending_speed) is not None:
+                self._pending_speed = None
+                speed, percentage = request
+                if speed != self._last_sent_speed:
+                    await self._ccb.set_speed(speed)
+                    self._last_sent_speed = speed
+                self._attr_percentage = percentage
+                self.async_write_ha_state()
+        except Exception:
+            # Drop anything queued behind the failed command, the state still reflects the bridge
+            self._pending_speed = None
+            raise
+        finally:
+            self._requested_speed = None
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         if preset_mode not in self.preset_modes:
             _LOGGER.warning("Invalid preset mode: %s", preset_mode)
             return
+        # Compare against the latest queued or in-flight mode, the cached state lags behind the queue
+        if preset_mode == (self._requested_mode or self._attr_preset_mode):
+            return
 
-        await self._ccb.set_mode(preset_mode)
-        self._attr_preset_mode = preset_mode
-        self.schedule_update_ha_state()
+        await self._async_send_mode(preset_mode)
+
+    async def _async_send_mode(self, preset_mode: str) -> None:
+        """Send a preset mode to the bridge, even if it matches the current one."""
+        self._requested_mode = preset_mode
+        self._pending_mode = preset_mode
+        if self._mode_task is None or self._mode_task.done():
+            self._mode_task = self.hass.async_create_task(self._async_send_pending_mode())
+        await asyncio.shield(self._mode_task)
+
+    async def _async_send_pending_mode(self) -> None:
+        """Send the latest requested mode, dropping modes superseded while a command was in flight."""
+        try:
+            while (preset_mode := self._pending_mode) is not None:
+                self._pending_mode = None
+                await self._ccb.set_mode(preset_mode)
+                self._attr_preset_mode = preset_mode
+                self.async_write_ha_state()
+        except Exception:
+            # Drop anything queued behind the failed command, the state still reflects the bridge
+            self._pending_mode = None
+            raise
+        finally:
+            self._requested_mode = None